@@ -1,8 +1,12 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
 from app.api.routes import users, auth, posts, comments,tags
-from app.core.middleware import request_logging_middleware
+from app.core.cache import close_cache
+from app.core.middleware import RequestLoggingMiddleware, start_access_log
+from app.schemas.post import PostWithComments
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -13,11 +17,33 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: builds the deferred response schemas, starts the
+    background access log writer and releases shared resources on shutdown.
+    """
+    # The *InDB schemas use defer_build; a single top-level rebuild of the
+    # nested post schema resolves its name references and lets pydantic-core
+    # reuse the user/comment/tag validators, so the first request does not
+    # pay for the build.
+    PostWithComments.model_rebuild()
+    access_log = start_access_log()
+    yield
+    await close_cache()
+    access_log.stop()
+
+
+# No default_response_class is set on purpose: with the default JSONResponse and a
+# response_model, FastAPI (>= 0.130) serializes straight to JSON bytes in
+# pydantic-core, which a custom class would disable. Hot endpoints that bypass
+# Pydantic return MsgspecJSONResponse explicitly.
 app = FastAPI(
     title="FastCRUD API",
     version="0.1.0",
     description="A RESTful API built with FastAPI, Pydantic v2, and SQLAlchemy.",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
@@ -26,4 +52,4 @@ app.include_router(posts.router, prefix="/posts", tags=["Posts"])
 app.include_router(comments.router, prefix="/comments", tags=["Comments"])
 app.include_router(tags.router, prefix="/tags", tags=["Tags"])
 
-app.middleware("http")(request_logging_middleware)
+app.add_middleware(RequestLoggingMiddleware)
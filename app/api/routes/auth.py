@@ -2,11 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserInDB
 from app.schemas.auth import Token
+from app.core.cache import USERS_LIST_NAMESPACE, cache_invalidate
 from app.core.security import get_password_hash, verify_password, create_access_token, get_current_active_user
 
 
@@ -21,23 +23,32 @@ async def register_user(
     """
     Registers a new user in the system.
     """
-    existing_user = await db.execute(select(User).filter(User.email == user_in.email))
-    if existing_user.scalar_one_or_none():
+    existing = await db.execute(select(User.id).filter(User.email == user_in.email))
+    if existing.first() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists."
         )
 
-    hashed_password = get_password_hash(user_in.password)
-    db_user = User(
-        email=user_in.email,
-        hashed_password=hashed_password,
-        is_active=user_in.is_active,
-        is_superuser=user_in.is_superuser
+    result = await db.execute(
+        pg_insert(User)
+        .values(
+            email=user_in.email,
+            hashed_password=await get_password_hash(user_in.password),
+            is_active=user_in.is_active,
+            is_superuser=user_in.is_superuser
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
-    db.add(db_user)
+    db_user = result.scalar_one_or_none()
+    if db_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists."
+        )
     await db.commit()
-    await db.refresh(db_user)
+    await cache_invalidate(USERS_LIST_NAMESPACE)
     return db_user
 
 
@@ -52,7 +63,7 @@ async def login_for_access_token(
     result = await db.execute(select(User).filter(User.email == form_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
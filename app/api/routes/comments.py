@@ -1,20 +1,51 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, insert, literal, select, update
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.session import get_async_db
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
-from app.schemas.comment import CommentCreate, CommentUpdate, CommentInDB
+from app.schemas.comment import (
+    CommentCreate,
+    CommentInDB,
+    CommentStruct,
+    CommentUpdate,
+    PaginatedComments,
+)
 from app.core.security import get_current_active_user, get_current_active_superuser
-from app.utils.pagination import PaginatedResponse, paginate
+from app.core.cache import (
+    COMMENTS_DETAIL_NAMESPACE,
+    COMMENTS_LIST_NAMESPACE,
+    cache_get,
+    cache_set,
+    cache_invalidate,
+    comment_namespace,
+    post_namespace,
+)
+from app.core.responses import MsgspecJSONResponse
+from app.utils.pagination import MAX_PAGE_LIMIT, PaginatedStruct, paginate
 
 router = APIRouter()
 
+_COMMENT_BY_ID_INCLUDING_DELETED = (
+    select(Comment)
+    .options(selectinload(Comment.owner), raiseload("*"))
+    .filter(Comment.id == bindparam("comment_id"))
+)
+_COMMENT_BY_ID = _COMMENT_BY_ID_INCLUDING_DELETED.filter(Comment.is_deleted == False)
+
+# List statements, filtered and paginated per request
+_COMMENTS_INCLUDING_DELETED = (
+    select(Comment)
+    .options(selectinload(Comment.owner), raiseload("*"))
+)
+_COMMENTS = _COMMENTS_INCLUDING_DELETED.filter(Comment.is_deleted == False)
+
 
 @router.post("/", response_model=CommentInDB, status_code=status.HTTP_201_CREATED)
 async def create_comment(
@@ -26,65 +57,80 @@ async def create_comment(
     Creates a new comment on a post. Requires authentication.
     The current authenticated user will be set as the owner.
     """
-    post_result = await db.execute(
-        select(Post).filter(Post.id == comment_in.post_id,
-                            Post.is_deleted == False)
+    # Verify the post and insert the comment in one round-trip:
+    # INSERT ... SELECT only produces a row when the post exists and is not deleted.
+    insert_stmt = (
+        insert(Comment)
+        .from_select(
+            ["content", "owner_id", "post_id"],
+            select(
+                literal(comment_in.content),
+                literal(current_user.id),
+                Post.id
+            ).filter(Post.id == comment_in.post_id, Post.is_deleted == False)
+        )
+        .returning(Comment)
     )
-    post = post_result.scalar_one_or_none()
-    if not post:
+    result = await db.execute(insert_stmt)
+    db_comment = result.scalar_one_or_none()
+    if db_comment is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
-
-    db_comment = Comment(
-        **comment_in.model_dump(),
-        owner_id=current_user.id
-    )
-    db.add(db_comment)
     await db.commit()
-    await db.refresh(db_comment)
+    await cache_invalidate(post_namespace(comment_in.post_id), COMMENTS_LIST_NAMESPACE)
 
-    # Re-query to eagerly load owner for response
-    result = await db.execute(
-        select(Comment)
-        .options(selectinload(Comment.owner))
-        .filter(Comment.id == db_comment.id)
-    )
-    fully_loaded_comment = result.scalar_one()
-    return fully_loaded_comment
+    # The owner is the already loaded current user, so no re-query is needed.
+    set_committed_value(db_comment, "owner", current_user)
+    return db_comment
 
 
-@router.get("/", response_model=PaginatedResponse[CommentInDB])
+@router.get("/", response_model=PaginatedComments)
 async def read_comments(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
     post_id: Optional[int] = None,
     include_deleted: bool = False,
-    skip: int = 0,
-    limit: int = 100
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None
 ):
     """
     Retrieves a paginated list of all comments, optionally filtered by post_id.
+    Comments are returned newest first; pass the returned 'next_cursor' as
+    'cursor' to fetch the following page ('skip' is kept for back-compat).
     By default, only non-deleted comments are returned. Superusers can
     set 'include_deleted=true' to see all comments.
     """
-    query = (
-        select(Comment)
-        .options(selectinload(Comment.owner))
-    )
-
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only superusers can view deleted comments."
         )
 
-    if not include_deleted:
-        query = query.filter(Comment.is_deleted == False)
+    cache_key = f"comments:list:{post_id}:{include_deleted}:{skip}:{limit}:{cursor}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    query = _COMMENTS_INCLUDING_DELETED if include_deleted else _COMMENTS
 
     if post_id:
         query = query.filter(Comment.post_id == post_id)
 
-    return await paginate(db, query, skip, limit)
+    page = await paginate(
+        db, query, skip, limit,
+        keyset=(Comment.created_at, Comment.id),
+        cursor=cursor
+    )
+    response = MsgspecJSONResponse(PaginatedStruct(
+        total=page.total,
+        offset=page.offset,
+        limit=page.limit,
+        items=[CommentStruct.from_orm(comment) for comment in page.items],
+        next_cursor=page.next_cursor
+    ))
+    await cache_set(cache_key, response.body, namespace=COMMENTS_LIST_NAMESPACE)
+    return response
 
 
 @router.get("/{comment_id}", response_model=CommentInDB)
@@ -99,25 +145,29 @@ async def read_comment(
     By default, only non-deleted comments are returned. Superusers can
     set 'include_deleted=true' to retrieve a deleted comment.
     """
-    query = select(Comment).options(selectinload(Comment.owner))
-
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only superusers can view deleted comments."
         )
 
-    if not include_deleted:
-        query = query.filter(Comment.is_deleted == False)
+    cache_key = f"comment:{comment_id}:{include_deleted}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    result = await db.execute(
-        query.filter(Comment.id == comment_id)
-    )
+    query = _COMMENT_BY_ID_INCLUDING_DELETED if include_deleted else _COMMENT_BY_ID
+    result = await db.execute(query, {"comment_id": comment_id})
     comment = result.scalar_one_or_none()
     if comment is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found.")
-    return comment
+
+    response = MsgspecJSONResponse(CommentStruct.from_orm(comment))
+    await cache_set(
+        cache_key, response.body,
+        namespace=(comment_namespace(comment_id), COMMENTS_DETAIL_NAMESPACE))
+    return response
 
 
 @router.put("/{comment_id}", response_model=CommentInDB)
@@ -130,12 +180,12 @@ async def update_comment(
     """
     Updates an existing comment. Requires authentication and ownership.
     """
-    result = await db.execute(
-        select(Comment)
-        .filter(Comment.id == comment_id, Comment.is_deleted == False)
+    db_comment = await db.get(
+        Comment,
+        comment_id,
+        options=[selectinload(Comment.owner), raiseload("*")]
     )
-    db_comment = result.scalar_one_or_none()
-    if db_comment is None:
+    if db_comment is None or db_comment.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found.")
 
@@ -144,21 +194,21 @@ async def update_comment(
                             detail="Not authorized to update this comment.")
 
     update_data = comment_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_comment, field, value)
-
-    db.add(db_comment)
-    await db.commit()
-    await db.refresh(db_comment)
-
-    # Re-query to eagerly load owner for response
-    result = await db.execute(
-        select(Comment)
-        .options(selectinload(Comment.owner))
-        .filter(Comment.id == db_comment.id)
-    )
-    fully_loaded_comment = result.scalar_one()
-    return fully_loaded_comment
+    if update_data:
+        await db.execute(
+            update(Comment)
+            .where(Comment.id == comment_id)
+            .values(**update_data)
+            .returning(Comment)
+            .execution_options(synchronize_session="fetch")
+        )
+        await db.commit()
+        await cache_invalidate(
+            comment_namespace(comment_id),
+            post_namespace(db_comment.post_id),
+            COMMENTS_LIST_NAMESPACE
+        )
+    return db_comment
 
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -171,19 +221,32 @@ async def delete_comment(
     Soft-deletes a comment. Requires authentication and ownership.
     """
     result = await db.execute(
-        select(Comment)
-        .filter(Comment.id == comment_id, Comment.is_deleted == False)
+        update(Comment)
+        .where(
+            Comment.id == comment_id,
+            Comment.is_deleted == False,
+            Comment.owner_id == current_user.id
+        )
+        .values(is_deleted=True)
+        .returning(Comment.post_id)
     )
-    db_comment = result.scalar_one_or_none()
-    if db_comment is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found.")
-
-    if db_comment.owner_id != current_user.id:
+    deleted = result.first()
+    if deleted is None:
+        # Nothing was updated: tell a missing comment apart from a foreign one.
+        existing = await db.execute(
+            select(Comment.id).filter(Comment.id == comment_id,
+                                      Comment.is_deleted == False)
+        )
+        if existing.first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found.")
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="Not authorized to delete this comment.")
 
-    db_comment.is_deleted = True
-    db.add(db_comment)
     await db.commit()
+    await cache_invalidate(
+        comment_namespace(comment_id),
+        post_namespace(deleted.post_id),
+        COMMENTS_LIST_NAMESPACE
+    )
     return
@@ -1,22 +1,53 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.session import get_async_db
 from app.models.post import Post
 from app.models.user import User
 from app.models.comment import Comment
-from app.schemas.post import PostCreate, PostUpdate, PostInDB
+from app.schemas.post import (
+    DEFAULT_POST_LIST_EXPANSIONS,
+    PaginatedPosts,
+    PostCreate,
+    PostExpansion,
+    PostStruct,
+    PostUpdate,
+    PostWithComments,
+)
 from app.core.security import get_current_active_user, get_current_active_superuser
-from app.utils.pagination import PaginatedResponse, paginate
+from app.core.cache import (
+    POSTS_DETAIL_NAMESPACE,
+    cache_get,
+    cache_set,
+    cache_invalidate,
+    post_namespace,
+)
+from app.core.responses import MsgspecJSONResponse
+from app.utils.pagination import MAX_PAGE_LIMIT, PaginatedStruct, paginate
 
 router = APIRouter()
 
+# Built once at import and bound per request, so the compiled form is reused
+# Tags use selectinload: joining them would multiply the comment rows
+POST_BY_ID_INCLUDING_DELETED = (
+    select(Post)
+    .options(
+        joinedload(Post.owner),
+        joinedload(Post.comments).joinedload(Comment.owner),
+        selectinload(Post.tags),
+        raiseload("*")
+    )
+    .filter(Post.id == bindparam("post_id"))
+)
+POST_BY_ID = POST_BY_ID_INCLUDING_DELETED.filter(Post.is_deleted == False)
+
 
-@router.post("/", response_model=PostInDB, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=PostWithComments, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post_in: PostCreate,
     db: AsyncSession = Depends(get_async_db),
@@ -26,46 +57,55 @@ async def create_post(
     Creates a new post. Requires authentication.
     The current authenticated user will be set as the owner.
     """
-    db_post = Post(**post_in.model_dump(), owner_id=current_user.id)
-    db.add(db_post)
-    await db.commit()
-    await db.refresh(db_post)
+    # A single INSERT ... RETURNING builds the instance; fields are passed
+    # explicitly rather than through model_dump(), which would build an
+    # intermediate dict for every write.
     result = await db.execute(
-        select(Post)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-            selectinload(Post.tags)
+        insert(Post)
+        .values(
+            title=post_in.title,
+            content=post_in.content,
+            owner_id=current_user.id
         )
-        .filter(Post.id == db_post.id)
+        .returning(Post)
     )
-    fully_loaded_post = result.scalar_one()
-    return fully_loaded_post
+    db_post = result.scalar_one()
+    await db.commit()
 
+    # The owner is the already loaded current user and a new post has no
+    # comments or tags, so no re-query is needed.
+    set_committed_value(db_post, "owner", current_user)
+    set_committed_value(db_post, "comments", [])
+    set_committed_value(db_post, "tags", [])
+    return db_post
 
-@router.get("/", response_model=PaginatedResponse[PostInDB])
+
+@router.get("/", response_model=PaginatedPosts)
 async def read_posts(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
-    skip: int = 0,
-    limit: int = 100,
-    include_deleted: bool = False
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_LIMIT),
+    include_deleted: bool = False,
+    cursor: Optional[str] = None,
+    expand: Set[PostExpansion] = Query(
+        default_factory=lambda: set(DEFAULT_POST_LIST_EXPANSIONS),
+        description="Relationships to embed in each post. Defaults to the owner "
+                    "and tags; comments are opt-in and 'none' returns only the "
+                    "post summaries."
+    )
 ):
     """
     Retrieves a paginated list of all posts. Requires authentication.
-    Includes owner, comments (with comment owners), and tags data.
+    Includes owner and tags data by default; comments (with comment owners)
+    are only loaded when asked for with 'expand' (e.g.
+    'expand=owner&expand=tags&expand=comments'). Relationships that are not
+    expanded are returned as null or empty lists.
+    Posts are returned newest first; pass the returned 'next_cursor' as
+    'cursor' to fetch the following page ('skip' is kept for back-compat).
     By default, only non-deleted posts are returned. Superusers can
     set 'include_deleted=true' to see all posts, including soft-deleted ones.
     """
-    query = (
-        select(Post)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-            selectinload(Post.tags)
-        )
-    )
-
     # Permission check for include_deleted
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
@@ -73,14 +113,39 @@ async def read_posts(
             detail="Only superusers can view deleted posts."
         )
 
+    # Only load what the client asked for; each skipped relationship saves a
+    # selectin round-trip, and raiseload guards against accidental lazy loads.
+    options = []
+    if "owner" in expand:
+        options.append(selectinload(Post.owner))
+    if "comments" in expand:
+        options.append(selectinload(Post.comments).selectinload(Comment.owner))
+    if "tags" in expand:
+        options.append(selectinload(Post.tags))
+    query = select(Post).options(*options, raiseload("*"))
+
     # Apply soft-delete filter if not including deleted
     if not include_deleted:
         query = query.filter(Post.is_deleted == False)
 
-    return await paginate(db, query, skip, limit)
+    page = await paginate(
+        db, query, skip, limit,
+        keyset=(Post.created_at, Post.id),
+        cursor=cursor,
+        # The list is not cached in Redis, so its total can be reused briefly
+        total_key=("posts", include_deleted)
+    )
+    # Encoded with msgspec; response_model only documents the schema
+    return MsgspecJSONResponse(PaginatedStruct(
+        total=page.total,
+        offset=page.offset,
+        limit=page.limit,
+        items=[PostStruct.from_orm(post, expand) for post in page.items],
+        next_cursor=page.next_cursor
+    ))
 
 
-@router.get("/{post_id}", response_model=PostInDB)
+@router.get("/{post_id}", response_model=PostWithComments)
 async def read_post(
     post_id: int,
     db: AsyncSession = Depends(get_async_db),
@@ -93,15 +158,6 @@ async def read_post(
     By default, only non-deleted posts are returned. Superusers can
     set 'include_deleted=true' to retrieve a soft-deleted post.
     """
-    query = (
-        select(Post)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-            selectinload(Post.tags)
-        )
-    )
-
     # Permission check for include_deleted
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
@@ -109,21 +165,29 @@ async def read_post(
             detail="Only superusers can view deleted posts."
         )
 
-    # Apply soft-delete filter if not including deleted
-    if not include_deleted:
-        query = query.filter(Post.is_deleted == False)
+    # Cached responses are only served after the permission check
+    cache_key = f"post:{post_id}:{include_deleted}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    result = await db.execute(
-        query.filter(Post.id == post_id)
-    )
-    post = result.scalar_one_or_none()
+    # Apply soft-delete filter if not including deleted
+    query = POST_BY_ID_INCLUDING_DELETED if include_deleted else POST_BY_ID
+    result = await db.execute(query, {"post_id": post_id})
+    # unique() collapses the duplicated post rows produced by the comments join
+    post = result.unique().scalar_one_or_none()
     if post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
-    return post
+
+    response = MsgspecJSONResponse(PostStruct.from_orm(post))
+    await cache_set(
+        cache_key, response.body,
+        namespace=(post_namespace(post_id), POSTS_DETAIL_NAMESPACE))
+    return response
 
 
-@router.put("/{post_id}", response_model=PostInDB)
+@router.put("/{post_id}", response_model=PostWithComments)
 async def update_post(
     post_id: int,
     post_in: PostUpdate,
@@ -133,12 +197,18 @@ async def update_post(
     """
     Updates an existing post. Requires authentication and ownership.
     """
-    result = await db.execute(
-        select(Post)
-        .filter(Post.id == post_id, Post.is_deleted == False)
+    # Relationships loaded here stay attached after commit (expire_on_commit=False)
+    db_post = await db.get(
+        Post,
+        post_id,
+        options=[
+            selectinload(Post.owner),
+            selectinload(Post.comments).selectinload(Comment.owner),
+            selectinload(Post.tags),
+            raiseload("*")
+        ]
     )
-    db_post = result.scalar_one_or_none()
-    if db_post is None:
+    if db_post is None or db_post.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
 
@@ -147,25 +217,19 @@ async def update_post(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="Not authorized to update this post.")
 
+    # UPDATE ... RETURNING refreshes the loaded instance in place
     update_data = post_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_post, field, value)
-
-    db.add(db_post)
-    await db.commit()
-    await db.refresh(db_post)
-
-    fully_loaded_post_result = await db.execute(
-        select(Post)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-            selectinload(Post.tags)
+    if update_data:
+        await db.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(**update_data)
+            .returning(Post)
+            .execution_options(synchronize_session="fetch")
         )
-        .filter(Post.id == db_post.id)
-    )
-    fully_loaded_post = fully_loaded_post_result.scalar_one()
-    return fully_loaded_post
+        await db.commit()
+        await cache_invalidate(post_namespace(post_id))
+    return db_post
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -177,21 +241,29 @@ async def delete_post(
     """
     Soft-deletes a post. Requires authentication and ownership.
     """
-    result = await db.execute(
-        select(Post)
-        .filter(Post.id == post_id, Post.is_deleted == False)
+    # Soft-delete and ownership check in a single UPDATE ... RETURNING
+    stmt = (
+        update(Post)
+        .where(Post.id == post_id, Post.is_deleted == False)
+        .values(is_deleted=True)
+        .returning(Post.id)
     )
-    db_post = result.scalar_one_or_none()
-    if db_post is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
-
     # Allow superusers to bypass the ownership check
-    if not current_user.is_superuser and db_post.owner_id != current_user.id:
+    if not current_user.is_superuser:
+        stmt = stmt.where(Post.owner_id == current_user.id)
+
+    result = await db.execute(stmt)
+    if result.first() is None:
+        # Nothing was updated: tell a missing post apart from a foreign one.
+        existing = await db.execute(
+            select(Post.id).filter(Post.id == post_id, Post.is_deleted == False)
+        )
+        if existing.first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="Not authorized to delete this post.")
 
-    db_post.is_deleted = True
-    db.add(db_post)
     await db.commit()
+    await cache_invalidate(post_namespace(post_id))
     return
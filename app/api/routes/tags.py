@@ -1,22 +1,46 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import raiseload
 
 from app.db.session import get_async_db
 from app.models.tag import Tag
-from app.models.post import Post
 from app.models.user import User
-from app.models.comment import Comment
-from app.schemas.tag import TagCreate, TagUpdate, TagInDB
-from app.schemas.post import PostInDB
+from app.schemas.tag import PaginatedTags, TagCreate, TagUpdate, TagInDB
+from app.schemas.post import PostWithComments
+from app.api.routes.posts import POST_BY_ID
 from app.core.security import get_current_active_user, get_current_active_superuser
-from app.utils.pagination import PaginatedResponse, paginate
+from app.core.cache import (
+    POSTS_DETAIL_NAMESPACE,
+    TAGS_LIST_NAMESPACE,
+    cache_get,
+    cache_set,
+    cache_invalidate,
+    post_namespace,
+)
+from app.utils.pagination import MAX_PAGE_LIMIT, paginate
 
 router = APIRouter()
 
+# Built once at import so list responses reuse the same serializer
+_TAG_PAGE_ADAPTER = TypeAdapter(PaginatedTags)
+
+_TAG_BY_ID_INCLUDING_DELETED = (
+    select(Tag)
+    .options(raiseload("*"))
+    .filter(Tag.id == bindparam("tag_id"))
+)
+_TAG_BY_ID = _TAG_BY_ID_INCLUDING_DELETED.filter(Tag.is_deleted == False)
+
+# List statements select plain columns: the rows are only serialized
+_TAGS_INCLUDING_DELETED = select(
+    Tag.id, Tag.name, Tag.is_deleted, Tag.created_at, Tag.updated_at)
+_TAGS = _TAGS_INCLUDING_DELETED.filter(Tag.is_deleted == False)
+
 
 @router.post("/", response_model=TagInDB, status_code=status.HTTP_201_CREATED)
 async def create_tag(
@@ -28,47 +52,67 @@ async def create_tag(
     Creates a new tag. Requires superuser privileges.
     Checks for uniqueness among non-deleted tags.
     """
-    existing_tag = await db.execute(
-        select(Tag).filter(Tag.name == tag_in.name, Tag.is_deleted == False)
+    # Insert and uniqueness check in one statement: the partial unique index
+    # on name arbitrates, and a conflicting insert simply returns no row.
+    result = await db.execute(
+        pg_insert(Tag)
+        .values(name=tag_in.name)
+        .on_conflict_do_nothing(
+            index_elements=[Tag.name],
+            index_where=Tag.is_deleted == False
+        )
+        .returning(Tag)
     )
-    if existing_tag.scalar_one_or_none():
+    db_tag = result.scalar_one_or_none()
+    if db_tag is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Tag with name '{tag_in.name}' already exists."
         )
-
-    db_tag = Tag(**tag_in.model_dump())
-    db.add(db_tag)
     await db.commit()
-    await db.refresh(db_tag)
+    await cache_invalidate(TAGS_LIST_NAMESPACE)
     return db_tag
 
 
-@router.get("/", response_model=PaginatedResponse[TagInDB])
+@router.get("/", response_model=PaginatedTags)
 async def read_tags(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
-    skip: int = 0,
-    limit: int = 100,
-    include_deleted: bool = False
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_LIMIT),
+    include_deleted: bool = False,
+    cursor: Optional[str] = None
 ):
     """
     Retrieves a paginated list of all tags. Requires authentication.
+    Tags are returned newest first; pass the returned 'next_cursor' as
+    'cursor' to fetch the following page ('skip' is kept for back-compat).
     By default, only non-deleted tags are returned. Superusers can
     set 'include_deleted=true' to see all tags, including soft-deleted ones.
     """
-    query = select(Tag)
-
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only superusers can view deleted tags."
         )
 
-    if not include_deleted:
-        query = query.filter(Tag.is_deleted == False)
-
-    return await paginate(db, query, skip, limit)
+    cache_key = f"tags:list:{include_deleted}:{skip}:{limit}:{cursor}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    query = _TAGS_INCLUDING_DELETED if include_deleted else _TAGS
+    # Keyset on the primary key, so cursor pages seek on its index
+    page = await paginate(
+        db, query, skip, limit,
+        keyset=(Tag.id,),
+        cursor=cursor,
+        response_model=TagInDB,
+        page_model=PaginatedTags
+    )
+    content = _TAG_PAGE_ADAPTER.dump_json(page)
+    await cache_set(cache_key, content, namespace=TAGS_LIST_NAMESPACE)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/{tag_id}", response_model=TagInDB)
@@ -83,20 +127,14 @@ async def read_tag(
     By default, only non-deleted tags are returned. Superusers can
     set 'include_deleted=true' to retrieve a soft-deleted tag.
     """
-    query = select(Tag)
-
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only superusers can view deleted tags."
         )
 
-    if not include_deleted:
-        query = query.filter(Tag.is_deleted == False)
-
-    result = await db.execute(
-        query.filter(Tag.id == tag_id)
-    )
+    query = _TAG_BY_ID_INCLUDING_DELETED if include_deleted else _TAG_BY_ID
+    result = await db.execute(query, {"tag_id": tag_id})
     tag = result.scalar_one_or_none()
     if tag is None:
         raise HTTPException(
@@ -114,10 +152,7 @@ async def update_tag(
     """
     Updates an existing tag. Requires superuser privileges.
     """
-    result = await db.execute(
-        select(Tag)
-        .filter(Tag.id == tag_id, Tag.is_deleted == False)
-    )
+    result = await db.execute(_TAG_BY_ID, {"tag_id": tag_id})
     db_tag = result.scalar_one_or_none()
     if db_tag is None:
         raise HTTPException(
@@ -129,7 +164,8 @@ async def update_tag(
 
     db.add(db_tag)
     await db.commit()
-    await db.refresh(db_tag)
+    # Cached post details embed their tags
+    await cache_invalidate(TAGS_LIST_NAMESPACE, POSTS_DETAIL_NAMESPACE)
     return db_tag
 
 
@@ -142,22 +178,23 @@ async def delete_tag(
     """
     Soft-deletes a tag. Requires superuser privileges.
     """
+    # Soft-delete with a bare UPDATE; the row is never loaded into the session.
     result = await db.execute(
-        select(Tag)
-        .filter(Tag.id == tag_id, Tag.is_deleted == False)
+        update(Tag)
+        .where(Tag.id == tag_id, Tag.is_deleted == False)
+        .values(is_deleted=True)
+        .returning(Tag.id)
     )
-    db_tag = result.scalar_one_or_none()
-    if db_tag is None:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found.")
 
-    db_tag.is_deleted = True
-    db.add(db_tag)
     await db.commit()
+    await cache_invalidate(TAGS_LIST_NAMESPACE, POSTS_DETAIL_NAMESPACE)
     return
 
 
-@router.post("/{tag_id}/add_to_post/{post_id}", response_model=PostInDB, status_code=status.HTTP_200_OK)
+@router.post("/{tag_id}/add_to_post/{post_id}", response_model=PostWithComments, status_code=status.HTTP_200_OK)
 async def add_tag_to_post(
     tag_id: int,
     post_id: int,
@@ -167,12 +204,8 @@ async def add_tag_to_post(
     """
     Adds a tag to a post. Requires authentication and either ownership of the post OR superuser privileges.
     """
-    post_result = await db.execute(
-        select(Post)
-        .options(selectinload(Post.tags))
-        .filter(Post.id == post_id, Post.is_deleted == False)
-    )
-    db_post = post_result.scalar_one_or_none()
+    post_result = await db.execute(POST_BY_ID, {"post_id": post_id})
+    db_post = post_result.unique().scalar_one_or_none()
     if db_post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
@@ -181,9 +214,7 @@ async def add_tag_to_post(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="Not authorized to modify this post.")
 
-    tag_result = await db.execute(
-        select(Tag).filter(Tag.id == tag_id, Tag.is_deleted == False)
-    )
+    tag_result = await db.execute(_TAG_BY_ID, {"tag_id": tag_id})
     db_tag = tag_result.scalar_one_or_none()
     if db_tag is None:
         raise HTTPException(
@@ -192,23 +223,11 @@ async def add_tag_to_post(
     if db_tag not in db_post.tags:
         db_post.tags.append(db_tag)
         await db.commit()
-        await db.refresh(db_post)
-
-    # Re-query the post with all relationships eagerly loaded for the response
-    fully_loaded_post_result = await db.execute(
-        select(Post)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-            selectinload(Post.tags)
-        )
-        .filter(Post.id == db_post.id)
-    )
-    fully_loaded_post = fully_loaded_post_result.scalar_one()
-    return fully_loaded_post
+        await cache_invalidate(post_namespace(post_id))
+    return db_post
 
 
-@router.post("/{tag_id}/remove_from_post/{post_id}", response_model=PostInDB, status_code=status.HTTP_200_OK)
+@router.post("/{tag_id}/remove_from_post/{post_id}", response_model=PostWithComments, status_code=status.HTTP_200_OK)
 async def remove_tag_from_post(
     tag_id: int,
     post_id: int,
@@ -218,12 +237,8 @@ async def remove_tag_from_post(
     """
     Removes a tag from a post. Requires authentication and either ownership of the post OR superuser privileges.
     """
-    post_result = await db.execute(
-        select(Post)
-        .options(selectinload(Post.tags))
-        .filter(Post.id == post_id, Post.is_deleted == False)
-    )
-    db_post = post_result.scalar_one_or_none()
+    post_result = await db.execute(POST_BY_ID, {"post_id": post_id})
+    db_post = post_result.unique().scalar_one_or_none()
     if db_post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Post not found.")
@@ -232,9 +247,7 @@ async def remove_tag_from_post(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="Not authorized to modify this post.")
 
-    tag_result = await db.execute(
-        select(Tag).filter(Tag.id == tag_id, Tag.is_deleted == False)
-    )
+    tag_result = await db.execute(_TAG_BY_ID, {"tag_id": tag_id})
     db_tag = tag_result.scalar_one_or_none()
     if db_tag is None:
         raise HTTPException(
@@ -243,17 +256,5 @@ async def remove_tag_from_post(
     if db_tag in db_post.tags:
         db_post.tags.remove(db_tag)
         await db.commit()
-        await db.refresh(db_post)
-
-    # Re-query the post with all relationships eagerly loaded for the response
-    fully_loaded_post_result = await db.execute(
-        select(Post)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-            selectinload(Post.tags)
-        )
-        .filter(Post.id == db_post.id)
-    )
-    fully_loaded_post = fully_loaded_post_result.scalar_one()
-    return fully_loaded_post
+        await cache_invalidate(post_namespace(post_id))
+    return db_post
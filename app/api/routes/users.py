@@ -1,16 +1,54 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import defer, raiseload
 
 from app.db.session import get_async_db
-from app.schemas.user import UserCreate, UserUpdate, UserInDB
+from app.schemas.user import PaginatedUsers, UserCreate, UserUpdate, UserInDB
 from app.models.user import User
-from app.core.security import get_current_active_superuser, get_password_hash, get_current_active_user
-from app.utils.pagination import PaginatedResponse, paginate
+from app.core.security import (
+    get_current_active_superuser,
+    get_current_active_user,
+    get_password_hash,
+    invalidate_cached_user,
+)
+from app.core.cache import (
+    COMMENTS_DETAIL_NAMESPACE,
+    COMMENTS_LIST_NAMESPACE,
+    POSTS_DETAIL_NAMESPACE,
+    USERS_LIST_NAMESPACE,
+    cache_get,
+    cache_set,
+    cache_invalidate,
+)
+from app.utils.pagination import MAX_PAGE_LIMIT, paginate
 
 router = APIRouter()
 
+_USER_PAGE_ADAPTER = TypeAdapter(PaginatedUsers)
+
+# UserInDB never exposes the password hash, so it is never fetched
+_USER_BY_ID_INCLUDING_DELETED = (
+    select(User)
+    .options(defer(User.hashed_password, raiseload=True), raiseload("*"))
+    .filter(User.id == bindparam("user_id"))
+)
+_USER_BY_ID = _USER_BY_ID_INCLUDING_DELETED.filter(User.is_deleted == False)
+
+_USERS_INCLUDING_DELETED = select(
+    User.id,
+    User.email,
+    User.is_active,
+    User.is_superuser,
+    User.is_deleted,
+    User.created_at,
+    User.updated_at
+)
+_USERS = _USERS_INCLUDING_DELETED.filter(User.is_deleted == False)
+
 
 @router.post("/", response_model=UserInDB, status_code=status.HTTP_201_CREATED)
 async def create_user(
@@ -22,41 +60,53 @@ async def create_user(
     Creates a new user in the system. Requires superuser privileges.
     The password will be hashed before storage.
     """
-    existing_user = await db.execute(select(User).filter(User.email == user_in.email))
-    if existing_user.scalar_one_or_none():
+    # Reject known emails before paying for the bcrypt hash
+    existing = await db.execute(select(User.id).filter(User.email == user_in.email))
+    if existing.first() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists."
         )
 
-    hashed_password = get_password_hash(user_in.password)
-    db_user = User(
-        email=user_in.email,
-        hashed_password=hashed_password,
-        is_active=user_in.is_active,
-        is_superuser=user_in.is_superuser
+    # ON CONFLICT covers a concurrent registration of the same email
+    result = await db.execute(
+        pg_insert(User)
+        .values(
+            email=user_in.email,
+            hashed_password=await get_password_hash(user_in.password),
+            is_active=user_in.is_active,
+            is_superuser=user_in.is_superuser
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
-    db.add(db_user)
+    db_user = result.scalar_one_or_none()
+    if db_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists."
+        )
     await db.commit()
-    await db.refresh(db_user)
+    await cache_invalidate(USERS_LIST_NAMESPACE)
     return db_user
 
 
-@router.get("/", response_model=PaginatedResponse[UserInDB])
+@router.get("/", response_model=PaginatedUsers)
 async def read_users(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_LIMIT),
     db: AsyncSession = Depends(get_async_db),
     # Superusers can list all users
     current_user: User = Depends(get_current_active_superuser),
-    include_deleted: bool = False
+    include_deleted: bool = False,
+    cursor: Optional[str] = None
 ):
     """
     Retrieves a paginated list of all non-deleted users. Requires superuser privileges.
+    Users are returned newest first; pass the returned 'next_cursor' as
+    'cursor' to fetch the following page ('skip' is kept for back-compat).
     Superusers can set 'include_deleted=true' to see all users, including soft-deleted ones.
     """
-    query = select(User)
-
     # Permission check for include_deleted
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
@@ -64,11 +114,23 @@ async def read_users(
             detail="Only superusers can view deleted users."
         )
 
-    # Apply soft-delete filter if not including deleted
-    if not include_deleted:
-        query = query.filter(User.is_deleted == False)
+    cache_key = f"users:list:{include_deleted}:{skip}:{limit}:{cursor}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    return await paginate(db, query, skip, limit)
+    # Apply soft-delete filter if not including deleted
+    query = _USERS_INCLUDING_DELETED if include_deleted else _USERS
+    page = await paginate(
+        db, query, skip, limit,
+        keyset=(User.id,),
+        cursor=cursor,
+        response_model=UserInDB,
+        page_model=PaginatedUsers
+    )
+    content = _USER_PAGE_ADAPTER.dump_json(page)
+    await cache_set(cache_key, content, namespace=USERS_LIST_NAMESPACE)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=UserInDB)
@@ -84,8 +146,6 @@ async def read_user(
     By default, only non-deleted users are retrieved. Superusers can
     set 'include_deleted=true' to retrieve a soft-deleted user.
     """
-    query = select(User)
-
     # Permission check for include_deleted
     if include_deleted and not current_user.is_superuser:
         raise HTTPException(
@@ -94,12 +154,8 @@ async def read_user(
         )
 
     # Apply soft-delete filter if not including deleted
-    if not include_deleted:
-        query = query.filter(User.is_deleted == False)
-
-    result = await db.execute(
-        query.filter(User.id == user_id)
-    )
+    query = _USER_BY_ID_INCLUDING_DELETED if include_deleted else _USER_BY_ID
+    result = await db.execute(query, {"user_id": user_id})
     user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(
@@ -118,10 +174,7 @@ async def update_user(
     Updates an existing user. Requires superuser privileges.
     If a new password is provided, it will be hashed.
     """
-    result = await db.execute(
-        select(User)
-        .filter(User.id == user_id, User.is_deleted == False)
-    )
+    result = await db.execute(_USER_BY_ID, {"user_id": user_id})
     db_user = result.scalar_one_or_none()
     if db_user is None:
         raise HTTPException(
@@ -130,13 +183,20 @@ async def update_user(
     update_data = user_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         if field == "password" and value is not None:
-            db_user.hashed_password = get_password_hash(value)
+            db_user.hashed_password = await get_password_hash(value)
         else:
             setattr(db_user, field, value)
 
     db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
+    await invalidate_cached_user(user_id)
+    # Cached posts and comments embed their owners
+    await cache_invalidate(
+        USERS_LIST_NAMESPACE,
+        POSTS_DETAIL_NAMESPACE,
+        COMMENTS_LIST_NAMESPACE,
+        COMMENTS_DETAIL_NAMESPACE,
+    )
     return db_user
 
 
@@ -151,15 +211,21 @@ async def delete_user(
     Requires superuser privileges.
     """
     result = await db.execute(
-        select(User)
-        .filter(User.id == user_id, User.is_deleted == False)
+        update(User)
+        .where(User.id == user_id, User.is_deleted == False)
+        .values(is_deleted=True)
+        .returning(User.id)
     )
-    db_user = result.scalar_one_or_none()
-    if db_user is None:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
 
-    db_user.is_deleted = True
-    db.add(db_user)
     await db.commit()
+    await invalidate_cached_user(user_id)
+    await cache_invalidate(
+        USERS_LIST_NAMESPACE,
+        POSTS_DETAIL_NAMESPACE,
+        COMMENTS_LIST_NAMESPACE,
+        COMMENTS_DETAIL_NAMESPACE,
+    )
     return
@@ -0,0 +1,123 @@
+import logging
+from typing import Optional, Sequence, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Caching is optional: without a REDIS_URL every lookup is a miss and writes are no-ops.
+redis_client: Optional[Redis] = (
+    Redis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+)
+
+
+# Namespaces group cache keys that are invalidated together
+COMMENTS_LIST_NAMESPACE = "comments:list"
+TAGS_LIST_NAMESPACE = "tags:list"
+USERS_LIST_NAMESPACE = "users:list"
+# Every cached post and comment detail is also registered here, because they
+# embed tags and users that are written through other routes.
+POSTS_DETAIL_NAMESPACE = "posts:detail"
+COMMENTS_DETAIL_NAMESPACE = "comments:detail"
+
+
+def post_namespace(post_id: int) -> str:
+    """Namespace for cached representations of a single post."""
+    return f"post:{post_id}"
+
+
+def comment_namespace(comment_id: int) -> str:
+    """Namespace for cached representations of a single comment."""
+    return f"comment:{comment_id}"
+
+
+def user_key(user_id: int) -> str:
+    """Key for the cached snapshot of an authenticated user."""
+    return f"user:{user_id}"
+
+
+def _namespace_key(namespace: str) -> str:
+    return f"ns:{namespace}"
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Returns the cached value for 'key', or None on a miss.
+    Redis failures are logged and treated as a miss.
+    """
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except RedisError:
+        logger.warning("Cache read failed for key %s", key, exc_info=True)
+        return None
+
+
+async def cache_set(
+    key: str,
+    value: bytes,
+    namespace: Union[str, Sequence[str], None] = None,
+    ttl: Optional[int] = None
+) -> None:
+    """
+    Stores 'value' under 'key'. When a 'namespace' (or a sequence of them) is
+    given the key is registered in it, so it can be dropped together with the
+    rest of the namespace by cache_invalidate(); otherwise it can only be
+    dropped with cache_delete().
+    """
+    if redis_client is None:
+        return
+    ttl = ttl if ttl is not None else settings.CACHE_TTL_SECONDS
+    try:
+        if namespace is None:
+            await redis_client.set(key, value, ex=ttl)
+            return
+        namespaces = (namespace,) if isinstance(namespace, str) else namespace
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ttl)
+            for name in namespaces:
+                pipe.sadd(_namespace_key(name), key)
+                pipe.expire(_namespace_key(name), ttl)
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Cache write failed for key %s", key, exc_info=True)
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Drops the given keys. Should be called after the write that invalidates
+    them has been committed.
+    """
+    if redis_client is None or not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except RedisError:
+        logger.warning("Cache delete failed for keys %s", keys, exc_info=True)
+
+
+async def cache_invalidate(*namespaces: str) -> None:
+    """
+    Drops every key registered in the given namespaces.
+    Should be called after the write that invalidates them has been committed.
+    """
+    if redis_client is None or not namespaces:
+        return
+    try:
+        for namespace in namespaces:
+            keys = await redis_client.smembers(_namespace_key(namespace))
+            await redis_client.delete(_namespace_key(namespace), *keys)
+    except RedisError:
+        logger.warning("Cache invalidation failed for %s", namespaces, exc_info=True)
+
+
+async def close_cache() -> None:
+    """
+    Closes the Redis connection pool on application shutdown.
+    """
+    if redis_client is not None:
+        await redis_client.aclose()
@@ -1,4 +1,6 @@
 import os
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,6 +14,40 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    # bcrypt cost factor for new hashes; each step doubles the hashing time.
+    # Existing hashes keep verifying with the cost they were created with.
+    BCRYPT_ROUNDS: int = 12
+
+    # Debug output, off by default: both log on the request path
+    SQL_ECHO: bool = False
+    LOG_REQUEST_TIMING: bool = False
+    # Requests slower than this are logged even when LOG_REQUEST_TIMING is off
+    SLOW_REQUEST_THRESHOLD_SECONDS: float = 1.0
+
+    # Connection pool sizing for the async engine
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    # Checks connections on checkout so ones dropped by the server are replaced
+    # instead of failing the request
+    DB_POOL_PRE_PING: bool = True
+    # Set when connecting through PgBouncer in transaction mode, which cannot
+    # keep prepared statements across transactions.
+    DB_USE_PGBOUNCER: bool = False
+
+    # Redis response cache; caching is disabled when no URL is configured
+    REDIS_URL: Optional[str] = None
+    CACHE_TTL_SECONDS: int = 300
+    # Kept short: a cached user outlives a deactivation only until it expires
+    # if the change does not go through the users API.
+    USER_CACHE_TTL_SECONDS: int = 60
+    # In-process copy in front of Redis, kept only for a few seconds since
+    # invalidations from other processes cannot reach it
+    USER_LOCAL_CACHE_TTL_SECONDS: int = 5
+    # In-process cache of pagination totals; list totals may lag writes by
+    # this long. Set to 0 to always count.
+    PAGINATION_COUNT_CACHE_TTL_SECONDS: int = 5
 
 
 settings = Settings()
@@ -1,17 +1,65 @@
+import logging
+import queue
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from logging.handlers import QueueHandler, QueueListener
 
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-async def request_logging_middleware(request: Request, call_next):
+from app.core.config import settings
+
+access_logger = logging.getLogger("app.access")
+
+
+def start_access_log() -> QueueListener:
+    """
+    Routes 'app.access' records through a queue, so the actual stream writes
+    happen on a background thread instead of blocking the event loop.
+    The returned listener must be stopped on shutdown to flush pending records.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    # Replace rather than add, so a restarted lifespan does not stack handlers
+    access_logger.handlers = [QueueHandler(log_queue)]
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+    listener.start()
+    return listener
+
+
+class RequestLoggingMiddleware:
     """
-    Middleware to log the response time of each request.
+    Middleware to report the response time of each request in the
+    'X-Process-Time' header. Requests slower than SLOW_REQUEST_THRESHOLD_SECONDS
+    are logged, and every request is when LOG_REQUEST_TIMING is set.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, which would wrap
+    every request in an extra task and stream the body through a memory channel.
     """
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    print(
-        f"Request: {request.method} {request.url.path} - Processed in: {process_time:.4f}s")
-    return response
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            # The handler has produced its response once the headers go out
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(process_time)
+                if settings.LOG_REQUEST_TIMING or process_time > settings.SLOW_REQUEST_THRESHOLD_SECONDS:
+                    access_logger.info(
+                        "Request: %s %s - Processed in: %.4fs",
+                        scope["method"], scope["path"], process_time)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,17 @@
+from typing import Any
+
+import msgspec
+from starlette.responses import JSONResponse
+
+# A single encoder instance is reused for every response to avoid per-request setup.
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response rendered with msgspec instead of the standard library encoder.
+    Accepts msgspec Structs as well as plain Python containers.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
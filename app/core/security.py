@@ -1,38 +1,67 @@
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
 from typing import Optional
 
+import msgspec
+from cachetools import TTLCache
 from passlib.context import CryptContext
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import defer, make_transient_to_detached
 
 from app.db.session import get_async_db
 from app.models.user import User
+from app.schemas.user import UserStruct
+from app.core.cache import cache_delete, cache_get, cache_set, user_key
 from app.core.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 # OAuth2PasswordBearer for handling token in request headers
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Built once at import: this lookup runs for every authenticated request on a
+# user cache miss, so it should always hit the compiled statement cache.
+# The password hash is never needed past login, so it is not fetched.
+_ACTIVE_USER_BY_ID = (
+    select(User)
+    .options(defer(User.hashed_password, raiseload=True))
+    .filter(User.id == bindparam("user_id"), User.is_deleted == False)
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# Recently verified tokens mapped to (user id, expiry), so a token presented
+# repeatedly is not re-verified and re-parsed on every request
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Per-process layer in front of the Redis user cache, keyed by user id, so a
+# burst of requests from the same user skips the Redis round-trip as well.
+_local_user_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=settings.USER_LOCAL_CACHE_TTL_SECONDS)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies if a plain password matches a hashed password.
+    bcrypt is deliberately slow, so it runs in the threadpool to keep the
+    event loop free.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """
-    Hashes a plain password.
+    Hashes a plain password, in the threadpool like verify_password.
     """
-    return pwd_context.hash(password)
+    return await run_in_threadpool(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -40,12 +69,12 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Creates a JWT access token.
     """
     to_encode = data.copy()
+    # 'exp' is encoded as an integer timestamp, so compute it directly
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expires_in = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(
-            timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+        expires_in = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode["exp"] = int(time.time()) + expires_in
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
@@ -64,23 +93,66 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY,
-                             algorithms=[settings.ALGORITHM])
-        user_id_str: str = payload.get("sub")  # Retrieve as string
-        if user_id_str is None:
+    cached_token = _token_cache.get(token)
+    if cached_token is not None and cached_token[1] > time.time():
+        user_id = cached_token[0]
+    else:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY,
+                                 algorithms=[settings.ALGORITHM])
+            user_id_str: str = payload.get("sub")  # Retrieve as string
+            if user_id_str is None:
+                raise credentials_exception
+            user_id: int = int(user_id_str)  # Explicitly convert to integer
+        except (InvalidTokenError, ValueError):  # Catch ValueError for conversion errors
             raise credentials_exception
-        user_id: int = int(user_id_str)  # Explicitly convert to integer
-    except (JWTError, ValueError):  # Catch ValueError for conversion errors
-        raise credentials_exception
-
-    result = await db.execute(select(User).filter(User.id == user_id, User.is_deleted == False))
+        # Only tokens carrying an expiry are cached, and never past it
+        if "exp" in payload:
+            _token_cache[token] = (user_id, payload["exp"])
+
+    snapshot = _local_user_cache.get(user_id)
+    if snapshot is None:
+        cached = await cache_get(user_key(user_id))
+        if cached is not None:
+            snapshot = msgspec.json.decode(cached, type=UserStruct)
+            _local_user_cache[user_id] = snapshot
+    if snapshot is not None:
+        return await _user_from_snapshot(db, snapshot)
+
+    result = await db.execute(_ACTIVE_USER_BY_ID, {"user_id": user_id})
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    snapshot = UserStruct.from_orm(user)
+    _local_user_cache[user_id] = snapshot
+    await cache_set(
+        user_key(user_id),
+        msgspec.json.encode(snapshot),
+        ttl=settings.USER_CACHE_TTL_SECONDS
+    )
     return user
 
 
+async def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drops the cached snapshot of a user after a committed change to it.
+    Other processes keep their local copy for at most USER_LOCAL_CACHE_TTL_SECONDS.
+    """
+    _local_user_cache.pop(user_id, None)
+    await cache_delete(user_key(user_id))
+
+
+async def _user_from_snapshot(db: AsyncSession, snapshot: UserStruct) -> User:
+    """
+    Rebuilds a User from its cached snapshot and attaches it to the session
+    without a SELECT, so routes can still use it as a regular ORM instance.
+    The password hash is never cached and stays unloaded.
+    """
+    user = User(**msgspec.structs.asdict(snapshot))
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """
     Dependency to get the current active user.
@@ -1,7 +1,6 @@
-from datetime import datetime
 from typing import TypeVar, Type
 
-from sqlalchemy import Column, DateTime, Boolean
+from sqlalchemy import Column, DateTime, Boolean, func
 from sqlalchemy.orm import declarative_mixin, declared_attr
 
 # Define a type variable for the ORM model instances
@@ -14,16 +13,28 @@ class TimestampMixin:
     Mixin that adds 'created_at' and 'updated_at' fields to SQLAlchemy models.
     'created_at' is set once on creation.
     'updated_at' is automatically updated on every modification.
+    Both are timezone-aware and filled in by PostgreSQL's now(), so the
+    statements carry no timestamp parameters; inserts and updates read the
+    resulting values back with RETURNING.
     """
+    # Fetch server-generated values in the same INSERT/UPDATE on ORM flushes,
+    # so instances stay fully loaded after commit without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr
     def created_at(cls):
         """Timestamp for when the record was created."""
-        return Column(DateTime, default=datetime.utcnow, nullable=False)
+        return Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     @declared_attr
     def updated_at(cls):
         """Timestamp for when the record was last updated."""
-        return Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+        return Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False
+        )
 
 
 @declarative_mixin
@@ -5,7 +5,25 @@ from sqlalchemy.ext.declarative import declarative_base
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+# asyncpg's prepared statement caches must be disabled behind PgBouncer in
+# transaction mode, since consecutive transactions may land on different
+# server connections.
+connect_args = (
+    {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    if settings.DB_USE_PGBOUNCER
+    else {}
+)
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args,
+)
 
 async_session_maker = async_sessionmaker(
     autocommit=False,
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, Text, ForeignKey
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import Index
 
 from app.db.session import Base
 from app.db.base import TimestampMixin, SoftDeleteMixin
@@ -20,3 +21,9 @@ class Comment(Base, TimestampMixin, SoftDeleteMixin):
     owner = relationship("User", back_populates="comments")
     # One-to-many relationship: Comment belongs to a Post
     post = relationship("Post", back_populates="comments")
+
+    # Serves loading a post's comments and listing them by post in keyset order.
+    # Not partial: a post's comments relationship also includes deleted ones.
+    __table_args__ = (
+        Index('ix_comments_post_id_created_at_id', 'post_id', 'created_at', 'id'),
+    )
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, Text, ForeignKey
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import Index
 
 from app.db.session import Base
 from app.db.base import TimestampMixin, SoftDeleteMixin
@@ -19,7 +20,19 @@ class Post(Base, TimestampMixin, SoftDeleteMixin):
     # One-to-many relationship: Post belongs to a User
     owner = relationship("User", back_populates="posts")
     # One-to-many relationship: Post has many Comments
-    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
+    # Posts are only ever soft-deleted, so the default cascade is enough
+    comments = relationship("Comment", back_populates="post")
     # Many-to-many relationship: Post has many Tags
     tags = relationship(
         "Tag", secondary=post_tag_association, back_populates="posts")
+
+    # Partial index matching the default post listing: non-deleted posts in
+    # keyset order, so both the first page and cursor seeks are index scans
+    __table_args__ = (
+        Index(
+            'ix_posts_created_at_id_non_deleted',
+            'created_at',
+            'id',
+            postgresql_where=Column('is_deleted') == False
+        ),
+    )
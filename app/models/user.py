@@ -17,9 +17,9 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     is_active: bool = Column(Boolean, default=True)
     is_superuser: bool = Column(Boolean, default=False)
 
+    # Users are only ever soft-deleted, so the relationships keep the default
+    # cascade instead of tracking children for hard deletes and orphans.
     # One-to-many relationship: User has many Posts
-    posts = relationship("Post", back_populates="owner",
-                         cascade="all, delete-orphan")
+    posts = relationship("Post", back_populates="owner")
     # One-to-many relationship: User has many Comments
-    comments = relationship(
-        "Comment", back_populates="owner", cascade="all, delete-orphan")
+    comments = relationship("Comment", back_populates="owner")
@@ -1,9 +1,11 @@
 from datetime import datetime
 from typing import Optional
 
+import msgspec
 from pydantic import BaseModel, Field
 
-from app.schemas.user import UserInDB  # For nested user data
+from app.schemas.user import UserInDB, UserStruct  # For nested user data
+from app.utils.pagination import PaginatedResponse
 
 
 class CommentBase(BaseModel):
@@ -35,20 +37,60 @@ class CommentInDB(CommentBase):
     Schema for comment data as stored in the database, including auto-generated fields and relationships.
     Used for responses.
     """
-    id: int = Field(..., description="Unique identifier for the comment.")
-    owner_id: int = Field(...,
-                          description="ID of the user who created the comment.")
-    post_id: int = Field(...,
-                         description="ID of the post the comment belongs to.")
-    is_deleted: bool = Field(...,
-                             description="Indicates if the comment is soft-deleted.")
-    created_at: datetime = Field(...,
-                                 description="Timestamp when the comment was created.")
-    updated_at: datetime = Field(...,
-                                 description="Timestamp when the comment was last updated.")
+    id: int
+    owner_id: int
+    post_id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
 
-    owner: Optional[UserInDB] = None  # Nested user data
+    owner: Optional["UserInDB"] = None  # Nested user data
 
     model_config = {
-        "from_attributes": True
+        "from_attributes": True,
+        "defer_build": True,
+        "extra": "ignore",
+        "populate_by_name": False,
+        "frozen": True
     }
+
+
+class PaginatedComments(PaginatedResponse[CommentInDB]):
+    """
+    Paginated list of comments, used as the list endpoint's response model.
+    """
+    model_config = {
+        "defer_build": False
+    }
+
+
+class CommentStruct(msgspec.Struct):
+    """
+    msgspec mirror of CommentInDB, used to serialize responses on hot list endpoints.
+    """
+    content: str
+    id: int
+    owner_id: int
+    post_id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+    owner: Optional[UserStruct] = None
+
+    @classmethod
+    def from_orm(cls, comment) -> "CommentStruct":
+        """
+        Builds the struct directly from a Comment ORM instance, skipping validation.
+        Expects 'owner' to be eagerly loaded.
+        """
+        owner = comment.owner
+        return cls(
+            content=comment.content,
+            id=comment.id,
+            owner_id=comment.owner_id,
+            post_id=comment.post_id,
+            is_deleted=comment.is_deleted,
+            created_at=comment.created_at,
+            updated_at=comment.updated_at,
+            owner=UserStruct.from_orm(owner) if owner is not None else None,
+        )
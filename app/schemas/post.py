@@ -1,11 +1,20 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Literal, Set
 
+import msgspec
 from pydantic import BaseModel, Field
 
-from app.schemas.user import UserInDB
-from app.schemas.comment import CommentInDB
-from app.schemas.tag import TagInDB
+from app.schemas.user import UserInDB, UserStruct
+from app.schemas.comment import CommentInDB, CommentStruct
+from app.schemas.tag import TagInDB, TagStruct
+from app.utils.pagination import PaginatedResponse
+
+# Relationships a client can ask to have embedded in list responses.
+# 'none' selects none of them, returning only the post summary.
+PostExpansion = Literal["owner", "comments", "tags", "none"]
+POST_EXPANSIONS = frozenset({"owner", "comments", "tags"})
+# Comments are opt-in on list responses; detail responses always embed them.
+DEFAULT_POST_LIST_EXPANSIONS = frozenset({"owner", "tags"})
 
 
 class PostBase(BaseModel):
@@ -36,28 +45,81 @@ class PostUpdate(PostBase):
 
 class PostInDB(PostBase):
     """
-    Schema for post data as stored in the database, including auto-generated fields and relationships.
+    Schema for post data as stored in the database, including auto-generated fields,
+    the owner and tags. Comments are only embedded by PostWithComments.
     Used for responses.
     """
-    id: int = Field(..., description="Unique identifier for the post.")
-    owner_id: int = Field(...,
-                          description="ID of the user who created the post.")
-    is_deleted: bool = Field(...,
-                             description="Indicates if the post is soft-deleted.")
-    created_at: datetime = Field(...,
-                                 description="Timestamp when the post was created.")
-    updated_at: datetime = Field(...,
-                                 description="Timestamp when the post was last updated.")
+    id: int
+    owner_id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+    owner: Optional["UserInDB"] = None
+    tags: List["TagInDB"] = []
+
+    model_config = {
+        "from_attributes": True,
+        "defer_build": True,
+        "extra": "ignore",
+        "populate_by_name": False,
+        "frozen": True
+    }
+
+
+class PostWithComments(PostInDB):
+    """
+    Schema for a post with its comments (and the comment owners) embedded.
+    Used for single-post responses.
+    """
+    comments: List["CommentInDB"] = []
 
-    owner: Optional[UserInDB] = None
-    comments: List[CommentInDB] = []
-    tags: List[TagInDB] = []
 
+class PaginatedPosts(PaginatedResponse[PostWithComments]):
+    """
+    Paginated list of posts, used as the list endpoint's response model.
+    """
     model_config = {
-        "from_attributes": True
+        "defer_build": False
     }
 
 
-# This line is good practice for Pydantic to resolve forward references correctly
-# when models reference each other (Circular Dependency xd).
-PostInDB.model_rebuild()
+class PostStruct(msgspec.Struct):
+    """
+    msgspec mirror of PostWithComments, used to serialize responses on hot endpoints.
+    """
+    title: str
+    content: str
+    id: int
+    owner_id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+    owner: Optional[UserStruct] = None
+    comments: List[CommentStruct] = []
+    tags: List[TagStruct] = []
+
+    @classmethod
+    def from_orm(cls, post, expand: Optional[Set[str]] = None) -> "PostStruct":
+        """
+        Builds the struct directly from a Post ORM instance, skipping validation.
+        Only the relationships named in 'expand' are read (all of them when None);
+        they must be eagerly loaded, the others are left at their defaults.
+        """
+        if expand is None:
+            expand = POST_EXPANSIONS
+        owner = post.owner if "owner" in expand else None
+        return cls(
+            title=post.title,
+            content=post.content,
+            id=post.id,
+            owner_id=post.owner_id,
+            is_deleted=post.is_deleted,
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+            owner=UserStruct.from_orm(owner) if owner is not None else None,
+            comments=[CommentStruct.from_orm(c) for c in post.comments]
+            if "comments" in expand else [],
+            tags=[TagStruct.from_orm(t) for t in post.tags]
+            if "tags" in expand else [],
+        )
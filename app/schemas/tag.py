@@ -1,8 +1,11 @@
 from datetime import datetime
 from typing import Optional, List
 
+import msgspec
 from pydantic import BaseModel, Field
 
+from app.utils.pagination import PaginatedResponse
+
 
 class TagBase(BaseModel):
     """
@@ -32,14 +35,61 @@ class TagInDB(TagBase):
     Schema for tag data as stored in the database, including auto-generated fields.
     Used for responses.
     """
-    id: int = Field(..., description="Unique identifier for the tag.")
-    is_deleted: bool = Field(...,
-                             description="Indicates if the tag is soft-deleted.")
-    created_at: datetime = Field(...,
-                                 description="Timestamp when the tag was created.")
-    updated_at: datetime = Field(...,
-                                 description="Timestamp when the tag was last updated.")
+    id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
 
     model_config = {
-        "from_attributes": True
+        "from_attributes": True,
+        "defer_build": True,
+        "extra": "ignore",
+        "populate_by_name": False,
+        "frozen": True
     }
+
+    @classmethod
+    def from_orm_trusted(cls, tag) -> "TagInDB":
+        """
+        Builds the schema from a Tag ORM instance, or a Core row with the same
+        columns, with model_construct, skipping validation. Only for rows read
+        from the database, never for client input.
+        """
+        return cls.model_construct(
+            name=tag.name,
+            id=tag.id,
+            is_deleted=tag.is_deleted,
+            created_at=tag.created_at,
+            updated_at=tag.updated_at,
+        )
+
+
+class PaginatedTags(PaginatedResponse[TagInDB]):
+    """
+    Paginated list of tags, used as the list endpoint's response model.
+    """
+    model_config = {
+        "defer_build": False
+    }
+
+
+class TagStruct(msgspec.Struct):
+    """
+    msgspec mirror of TagInDB, used to serialize responses on hot list endpoints.
+    """
+    name: str
+    id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_orm(cls, tag) -> "TagStruct":
+        """Builds the struct directly from a Tag ORM instance, skipping validation."""
+        return cls(
+            name=tag.name,
+            id=tag.id,
+            is_deleted=tag.is_deleted,
+            created_at=tag.created_at,
+            updated_at=tag.updated_at,
+        )
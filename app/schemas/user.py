@@ -1,8 +1,11 @@
 from datetime import datetime
 from typing import Optional
 
+import msgspec
 from pydantic import BaseModel, EmailStr, Field
 
+from app.utils.pagination import PaginatedResponse
+
 
 class UserBase(BaseModel):
     """
@@ -51,14 +54,70 @@ class UserInDB(UserBase):
     Schema for user data as stored in the database, including auto-generated fields.
     Used for responses.
     """
-    id: int = Field(..., description="Unique identifier for the user.")
-    is_deleted: bool = Field(...,
-                             description="Indicates if the user is soft-deleted.")
-    created_at: datetime = Field(...,
-                                 description="Timestamp when the user was created.")
-    updated_at: datetime = Field(...,
-                                 description="Timestamp when the user was last updated.")
+    # Emails were validated as EmailStr on the way in, so responses read them
+    # back as plain strings instead of re-running the email validator per row.
+    email: str
+    id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
 
     model_config = {
-        "from_attributes": True  # Allow Pydantic to read ORM model attributes
+        "from_attributes": True,  # Allow Pydantic to read ORM model attributes
+        "defer_build": True,  # Build the validator on first use, not at import
+        "extra": "ignore",
+        "populate_by_name": False,
+        "frozen": True  # Response-only: instances are never modified
     }
+
+    @classmethod
+    def from_orm_trusted(cls, user) -> "UserInDB":
+        """
+        Builds the schema from a User ORM instance, or a Core row with the same
+        columns, with model_construct, skipping validation. Only for rows read
+        from the database, never for client input.
+        """
+        return cls.model_construct(
+            email=user.email,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            id=user.id,
+            is_deleted=user.is_deleted,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class PaginatedUsers(PaginatedResponse[UserInDB]):
+    """
+    Paginated list of users, used as the list endpoint's response model.
+    """
+    model_config = {
+        "defer_build": False
+    }
+
+
+class UserStruct(msgspec.Struct):
+    """
+    msgspec mirror of UserInDB, used to serialize responses on hot list endpoints.
+    """
+    email: str
+    is_active: bool
+    is_superuser: bool
+    id: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_orm(cls, user) -> "UserStruct":
+        """Builds the struct directly from a User ORM instance, skipping validation."""
+        return cls(
+            email=user.email,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            id=user.id,
+            is_deleted=user.is_deleted,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
@@ -1,15 +1,40 @@
-from typing import Generic, List, TypeVar
+import asyncio
+import base64
+from typing import Annotated, Any, Callable, Generic, Hashable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+import msgspec
+from cachetools import TTLCache
+from fastapi import HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncResult, AsyncSession
+from sqlalchemy import BigInteger, Integer, SmallInteger, literal, select, func, tuple_
 from sqlalchemy.orm import Query
 
+from app.core.config import settings
+
 T = TypeVar("T")  # Generic type for the items in the list
 
+# Page rows are read from a server-side cursor in partitions of this size and
+# converted as they arrive, so a large page is never buffered twice.
+STREAM_PARTITION_SIZE = 256
+
+# Largest page a list endpoint accepts
+MAX_PAGE_LIMIT = 1000
+
+# Recent totals keyed by the caller's 'total_key'. Pages over the same filters
+# reuse them for a few seconds instead of counting again; totals can lag writes
+# by up to the TTL.
+_count_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=512, ttl=settings.PAGINATION_COUNT_CACHE_TTL_SECONDS)
+    if settings.PAGINATION_COUNT_CACHE_TTL_SECONDS > 0 else None
+)
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     Generic Pydantic model for paginated responses.
+    Each schema module declares a concrete subclass (e.g. PaginatedTags), so
+    the specialization is built once at import instead of on first use.
     """
     total: int = Field(..., description="Total number of items available.")
     offset: int = Field(...,
@@ -18,31 +43,202 @@ class PaginatedResponse(BaseModel, Generic[T]):
                        description="The maximum number of items per page.")
     items: List[T] = Field(...,
                            description="List of items for the current page.")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, or null on the last page.")
+
+
+class PaginatedStruct(msgspec.Struct, Generic[T]):
+    """
+    msgspec counterpart of PaginatedResponse, encoded directly on hot list endpoints.
+    """
+    total: int
+    offset: int
+    limit: int
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    return base64.urlsafe_b64encode(msgspec.json.encode(values)).decode()
+
+
+def _cursor_type(column: Any) -> Any:
+    # Integer columns are bounded to their SQL range, so an out-of-range cursor
+    # value fails decoding instead of overflowing when Postgres binds it.
+    column_type = column.type
+    if isinstance(column_type, Integer):
+        bits = (64 if isinstance(column_type, BigInteger)
+                else 16 if isinstance(column_type, SmallInteger) else 32)
+        return Annotated[int, msgspec.Meta(ge=-2 ** (bits - 1), le=2 ** (bits - 1) - 1)]
+    return column_type.python_type
+
+
+def _decode_cursor(cursor: str, keyset: Sequence[Any]) -> Tuple[Any, ...]:
+    types = Tuple[tuple(_cursor_type(column) for column in keyset)]
+    try:
+        return msgspec.json.decode(base64.urlsafe_b64decode(cursor), type=types)
+    except (ValueError, msgspec.DecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+
+def _count_statement(query: Query):
+    # Using .subquery() ensures that any joins or filters in the original query
+    # are correctly considered when calculating the total count.
+    # Ordering is dropped: it cannot change a count but would still be planned.
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def _cached_total(total_key: Optional[Hashable]) -> Optional[int]:
+    if total_key is None or _count_cache is None:
+        return None
+    return _count_cache.get(total_key)
+
+
+def _remember_total(total_key: Optional[Hashable], total: int) -> None:
+    if total_key is not None and _count_cache is not None:
+        _count_cache[total_key] = total
+
+
+async def _count(db: Union[AsyncSession, AsyncConnection], query: Query) -> int:
+    # The resulting statement has the same cache key for a given query shape,
+    # so SQLAlchemy compiles it once and reuses it from the compiled cache.
+    total_result = await db.execute(_count_statement(query))
+    return total_result.scalar_one()
+
+
+def _selects_entity(query: Query) -> bool:
+    # select(Model) yields ORM instances; a select of columns yields plain rows
+    description = query.column_descriptions[0]
+    return description["expr"] is description["entity"]
+
+
+async def _collect(
+    result: AsyncResult,
+    convert: Optional[Callable[[Any], Any]] = None,
+    entity: bool = True
+) -> Tuple[List[Any], Optional[int]]:
+    # Drains a streamed page, converting each item as its partition arrives.
+    # An item is the row's ORM instance, or the Core row itself for column
+    # selects. Also returns the '_total' window column when the query selects one.
+    items = []
+    total = None
+    async for partition in result.partitions():
+        if total is None:
+            total = partition[0]._mapping.get("_total")
+        rows = (row[0] for row in partition) if entity else partition
+        items.extend(rows if convert is None else map(convert, rows))
+    return items, total
 
 
 async def paginate(
     db: AsyncSession,
     query: Query,  
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    keyset: Optional[Sequence[Any]] = None,
+    cursor: Optional[str] = None,
+    response_model: Optional[Type[BaseModel]] = None,
+    page_model: Optional[Type[PaginatedResponse]] = None,
+    total_key: Optional[Hashable] = None
 ) -> PaginatedResponse[T]:
     """
     Applies pagination to a SQLAlchemy query and returns a PaginatedResponse.
+
+    When a 'response_model' with a from_orm_trusted() constructor is given,
+    items are converted with it and the page is built without validation as
+    a 'page_model' (PaginatedResponse[response_model] by default); the rows
+    come straight from the database, so they are trusted.
+
+    When 'keyset' columns are given, items are ordered by them (descending) and
+    the response carries a 'next_cursor'. Passing that cursor back seeks
+    straight past the previous page instead of scanning 'skip' rows, which is
+    then ignored.
+
+    Rows are streamed, so 'query' must not joinedload collections (which would
+    also break LIMIT); selectinload is batched per partition instead.
+    Read-only lists with no relationships can pass a Core select of columns
+    instead of select(Model): the rows then skip ORM hydration and the
+    identity map, and are converted straight from their attributes.
+
+    When a 'total_key' is given, the total is reused for
+    PAGINATION_COUNT_CACHE_TTL_SECONDS by every page with the same key, so it
+    must identify the query's filters (not its ordering, options or page).
+    Callers that store the page in the Redis cache must not pass one: a stale
+    total would otherwise outlive the write that invalidated the cached page.
     """
-    # Create a count query from the original query without limit/offset.
-    # Using .subquery() ensures that any joins or filters in the original query
-    # are correctly considered when calculating the total count.
-    total_count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(total_count_query)
-    total_items = total_result.scalar_one()
+    count_query = None
+    fetch = limit
+    if keyset:
+        query = query.order_by(*(column.desc() for column in keyset))
+        # Fetch one extra row to find out whether there is a next page
+        fetch = limit + 1
+        if cursor is not None:
+            # The total spans every page, so it is counted before the cursor filter
+            count_query = query
+            values = _decode_cursor(cursor, keyset)
+            query = query.filter(tuple_(*keyset) < tuple_(
+                *(literal(value, column.type) for column, value in zip(keyset, values))))
+            skip = 0
+
+    convert = response_model.from_orm_trusted if response_model is not None else None
+    entity = _selects_entity(query)
+    stream_options = {"yield_per": STREAM_PARTITION_SIZE}
+    paginated_items_query = query.offset(skip).limit(fetch)
+    total_items = _cached_total(total_key)
+    if total_items is not None:
+        # A recent total for the same filters: only the page itself is fetched
+        items_result = await db.stream(
+            paginated_items_query, execution_options=stream_options)
+        items, _ = await _collect(items_result, convert, entity)
+        if items:
+            # A total that lags an insert cannot be smaller than what was just read
+            total_items = max(total_items, skip + len(items[:limit]))
+    elif count_query is not None:
+        # The COUNT does not depend on the page, so it runs concurrently on a
+        # second pooled connection: a session must never run two statements at once.
+        async with db.bind.connect() as count_conn:
+            total_items, items_result = await asyncio.gather(
+                _count(count_conn, count_query),
+                db.stream(paginated_items_query, execution_options=stream_options)
+            )
+        items, _ = await _collect(items_result, convert, entity)
+        _remember_total(total_key, total_items)
+    else:
+        # count(*) OVER () is evaluated before LIMIT/OFFSET, so every row of the
+        # page carries the total and no separate COUNT round-trip is needed.
+        paginated_items_query = paginated_items_query.add_columns(
+            func.count().over().label("_total"))
+        items_result = await db.stream(
+            paginated_items_query, execution_options=stream_options)
+        items, total_items = await _collect(items_result, convert, entity)
+        if total_items is None:
+            # Past the last page there is no row to read the total from
+            total_items = await _count(db, query) if skip else 0
+        _remember_total(total_key, total_items)
+
+    next_cursor = None
+    if keyset and len(items) > limit:
+        items = items[:limit]
+        next_cursor = _encode_cursor(
+            [getattr(items[-1], column.key) for column in keyset])
 
-    paginated_items_query = query.offset(skip).limit(limit)
-    items_result = await db.execute(paginated_items_query)
-    items = items_result.scalars().unique().all()
+    if response_model is not None:
+        page_model = page_model or PaginatedResponse[response_model]
+        return page_model.model_construct(
+            total=total_items,
+            offset=skip,
+            limit=limit,
+            items=items,
+            next_cursor=next_cursor
+        )
 
-    return PaginatedResponse(
+    # The items are ORM rows for the caller to convert, so the page is built
+    # without running the generic model's validators over them.
+    return PaginatedResponse.model_construct(
         total=total_items,
         offset=skip,
         limit=limit,
-        items=items
+        items=items,
+        next_cursor=next_cursor
     )
@@ -0,0 +1,48 @@
+"""Use server-side timezone-aware timestamps
+
+Revision ID: 5667b89b2fd2
+Revises: 252f26a78f3f
+Create Date: 2026-10-14 12:53:35.213272
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5667b89b2fd2'
+down_revision: Union[str, Sequence[str], None] = '252f26a78f3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables using TimestampMixin
+TABLES = ('comments', 'posts', 'tags', 'users')
+COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values were written with datetime.utcnow(), so they are UTC.
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(table, column,
+                       existing_type=postgresql.TIMESTAMP(),
+                       type_=sa.DateTime(timezone=True),
+                       server_default=sa.text('now()'),
+                       existing_nullable=False,
+                       postgresql_using=f"{column} AT TIME ZONE 'UTC'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(table, column,
+                       existing_type=sa.DateTime(timezone=True),
+                       type_=postgresql.TIMESTAMP(),
+                       server_default=None,
+                       existing_nullable=False,
+                       postgresql_using=f"{column} AT TIME ZONE 'UTC'")